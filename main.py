@@ -2,9 +2,7 @@ from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
 
 from models import SearchResponse
-from parsers.age_parser import parse_age
-from parsers.gender_parser import parse_gender
-from parsers.time_parser import parse_time
+from parsers.query_parser import parse_all
 
 query_path_app = FastAPI()
 
@@ -22,22 +20,21 @@ query_path_app.add_middleware(
 
 
 @query_path_app.get("/search", response_model=SearchResponse)
-def search(search_query_string: str = Query(..., alias="q")):
+async def search(search_query_string: str = Query(..., alias="q")):
     normalized_query = search_query_string.lower()
 
-    search_result = {
-        # TODO: Implement value extraction of diagnosis field
-        "diagnosis": None,
-    }
-
-    age_details = parse_age(normalized_query)
-    gender = parse_gender(normalized_query)
-    time_details = parse_time(normalized_query)
-    search_result.update(age_details)
-    search_result["gender"] = gender
-    search_result.update(time_details)
+    age, gender, time = parse_all(normalized_query)
 
-    return search_result
+    return SearchResponse(
+        age=age.age,
+        age_limit_identifier=age.age_limit_identifier,
+        gender=gender,
+        # TODO: Implement value extraction of diagnosis field
+        diagnosis=None,
+        is_range=time.is_range,
+        time=time.time,
+        time_range=time.time_range,
+    )
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,5 +1,66 @@
 import datetime
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Full names and three-letter abbreviations, lower-cased, to weekday() numbers
+_WEEKDAY_INDEX = MappingProxyType({
+    **{name.lower(): index for index, name in enumerate(_WEEKDAY_NAMES)},
+    **{name[:3].lower(): index for index, name in enumerate(_WEEKDAY_NAMES)},
+})
+
+# Clock entry point; tests patch this name instead of the datetime module
+_today = datetime.date.today
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _days_in_month(year: int, month: int) -> int:
+    """Returns the number of days in the given month, accounting for leap years."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+def _add_months(value: datetime.date, months: int) -> datetime.date:
+    """Adds calendar months to a date, clamping the day to the length of the target month."""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    return value.replace(year=year, month=month, day=min(value.day, _days_in_month(year, month)))
+
+_OFFSET_BY_UNIT = MappingProxyType({
+    'days': lambda value, offset: value + datetime.timedelta(days=offset),
+    'weeks': lambda value, offset: value + datetime.timedelta(weeks=offset),
+    'months': _add_months,
+    'years': lambda value, offset: _add_months(value, 12 * offset),
+})
+
+_START_OF_PERIOD = MappingProxyType({
+    'week': lambda value: value - datetime.timedelta(days=value.weekday()),
+    'month': lambda value: value.replace(day=1),
+    'year': lambda value: value.replace(month=1, day=1),
+})
+
+_END_OF_PERIOD = MappingProxyType({
+    'week': lambda value: value + datetime.timedelta(days=6 - value.weekday()),
+    'month': lambda value: value.replace(day=_days_in_month(value.year, value.month)),
+    'year': lambda value: value.replace(month=12, day=31),
+})
+
+def _parse_date(date_str: str) -> datetime.date:
+    """
+    Parses a DD-MM-YYYY string into a date. The canonical zero-padded form is sliced directly;
+    anything else goes through strptime, which raises ValueError for invalid input.
+    """
+    if len(date_str) == 10 and date_str[2] == '-' and date_str[5] == '-':
+        day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            return datetime.date(int(year), int(month), int(day))
+    return datetime.datetime.strptime(date_str, "%d-%m-%Y").date()
+
+def _format_date(value: datetime.date) -> str:
+    """Formats a date as DD-MM-YYYY without going through strftime."""
+    return f"{value.day:02d}-{value.month:02d}-{value.year:04d}"
 
 def get_current_date():
     """
@@ -12,7 +73,7 @@ def get_current_date():
         - "What is today's date?"
         - "Current date"
     """
-    return datetime.date.today().strftime("%d-%m-%Y")
+    return _format_date(_today())
 
 def get_date_with_offset(offset: int, unit: str, base_date_str: str = None):
     """
@@ -32,16 +93,15 @@ def get_date_with_offset(offset: int, unit: str, base_date_str: str = None):
         - "Date 6 months after 01-01-2025" -> get_date_with_offset(6, 'months', '01-01-2025')
     """
     try:
-        base_date = datetime.datetime.strptime(base_date_str, "%d-%m-%Y").date() if base_date_str else datetime.date.today()
+        base_date = _parse_date(base_date_str) if base_date_str else _today()
     except (ValueError, TypeError):
         return "Invalid base_date_str format. Please use DD-MM-YYYY."
 
-    if unit not in ['days', 'weeks', 'months', 'years']:
+    apply_offset = _OFFSET_BY_UNIT.get(unit)
+    if apply_offset is None:
         return f"Invalid unit '{unit}'. Please use 'days', 'weeks', 'months', or 'years'."
 
-    delta = relativedelta(**{unit: offset})
-    new_date = base_date + delta
-    return new_date.strftime("%d-%m-%Y")
+    return _format_date(apply_offset(base_date, offset))
 
 def get_day_of_week(date_str: str = None):
     """
@@ -58,8 +118,8 @@ def get_day_of_week(date_str: str = None):
         - "What day is 25-12-2025?" -> get_day_of_week('25-12-2025')
     """
     try:
-        target_date = datetime.datetime.strptime(date_str, "%d-%m-%Y").date() if date_str else datetime.date.today()
-        return target_date.strftime('%A')
+        target_date = _parse_date(date_str) if date_str else _today()
+        return _WEEKDAY_NAMES[target_date.weekday()]
     except ValueError:
         return "Invalid date format. Please use DD-MM-YYYY."
 
@@ -68,7 +128,7 @@ def get_date_of_weekday(weekday_name: str, direction: str, base_date_str: str =
     Finds the date of the next or last occurrence of a specific weekday.
     
     Args:
-        weekday_name (str): Name of the weekday ('Monday', 'Tuesday', etc.)
+        weekday_name (str): Name of the weekday ('Monday', 'Tuesday', etc.) or its abbreviation ('Mon', 'Tue', etc.)
         direction (str): 'next' for future occurrence, 'last' for past occurrence
         base_date_str (str, optional): Base date in DD-MM-YYYY format. Uses current date if None.
     
@@ -79,33 +139,29 @@ def get_date_of_weekday(weekday_name: str, direction: str, base_date_str: str =
         - "When is next Monday?" -> get_date_of_weekday('Monday', 'next')
         - "When was last Friday?" -> get_date_of_weekday('Friday', 'last')
     """
-    days_of_week = [d.lower() for d in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']]
     weekday_name = weekday_name.lower()
-    if weekday_name not in days_of_week:
+    target_weekday = _WEEKDAY_INDEX.get(weekday_name)
+    if target_weekday is None:
         return f"Invalid weekday_name '{weekday_name}'."
 
     try:
-        base_date = datetime.datetime.strptime(base_date_str, "%d-%m-%Y").date() if base_date_str else datetime.date.today()
+        base_date = _parse_date(base_date_str) if base_date_str else _today()
     except (ValueError, TypeError):
         return "Invalid base_date_str format. Please use DD-MM-YYYY."
 
-    target_weekday = days_of_week.index(weekday_name)
     base_weekday = base_date.weekday()
 
+    # Shifting by one before the modulo maps a same-weekday difference of 0 to 7
     if direction == 'last':
-        day_diff = (base_weekday - target_weekday + 7) % 7
-        if day_diff == 0:
-            day_diff = 7
+        day_diff = (base_weekday - target_weekday - 1) % 7 + 1
         new_date = base_date - datetime.timedelta(days=day_diff)
     elif direction == 'next':
-        day_diff = (target_weekday - base_weekday + 7) % 7
-        if day_diff == 0:
-            day_diff = 7
+        day_diff = (target_weekday - base_weekday - 1) % 7 + 1
         new_date = base_date + datetime.timedelta(days=day_diff)
     else:
         return "Invalid direction. Please use 'next' or 'last'."
     
-    return new_date.strftime("%d-%m-%Y")
+    return _format_date(new_date)
 
 def get_start_of_period(period: str, base_date_str: str = None):
     """
@@ -124,19 +180,14 @@ def get_start_of_period(period: str, base_date_str: str = None):
         - "Start of this year" -> get_start_of_period('year')
     """
     try:
-        base_date = datetime.datetime.strptime(base_date_str, "%d-%m-%Y").date() if base_date_str else datetime.date.today()
+        base_date = _parse_date(base_date_str) if base_date_str else _today()
     except (ValueError, TypeError):
         return "Invalid base_date_str format. Please use DD-MM-YYYY."
 
-    if period == 'week':
-        start_date = base_date - datetime.timedelta(days=base_date.weekday())
-    elif period == 'month':
-        start_date = base_date.replace(day=1)
-    elif period == 'year':
-        start_date = base_date.replace(month=1, day=1)
-    else:
+    period_start = _START_OF_PERIOD.get(period)
+    if period_start is None:
         return "Invalid period. Use 'week', 'month', or 'year'."
-    return start_date.strftime("%d-%m-%Y")
+    return _format_date(period_start(base_date))
 
 def get_end_of_period(period: str, base_date_str: str = None):
     """
@@ -155,27 +206,23 @@ def get_end_of_period(period: str, base_date_str: str = None):
         - "End of this year" -> get_end_of_period('year')
     """
     try:
-        base_date = datetime.datetime.strptime(base_date_str, "%d-%m-%Y").date() if base_date_str else datetime.date.today()
+        base_date = _parse_date(base_date_str) if base_date_str else _today()
     except (ValueError, TypeError):
         return "Invalid base_date_str format. Please use DD-MM-YYYY."
 
-    if period == 'week':
-        end_date = base_date + datetime.timedelta(days=6 - base_date.weekday())
-    elif period == 'month':
-        next_month = base_date.replace(day=28) + datetime.timedelta(days=4) # Go to next month
-        end_date = next_month - datetime.timedelta(days=next_month.day)
-    elif period == 'year':
-        end_date = base_date.replace(month=12, day=31)
-    else:
+    period_end = _END_OF_PERIOD.get(period)
+    if period_end is None:
         return "Invalid period. Use 'week', 'month', or 'year'."
-    return end_date.strftime("%d-%m-%Y")
+    return _format_date(period_end(base_date))
 
-def get_date_range_for_week(offset: int = 0):
+def get_date_range_for_week(offset: int = 0, today: datetime.date = None):
     """
     Gets the start and end dates for a week, with an offset from the current week.
     
     Args:
         offset (int): Week offset from current week (0=current, -1=last, 1=next)
+        today (datetime.date, optional): Reference date. Uses current date if None; pass one
+            snapshot when computing several ranges so they all agree on "today".
     
     Returns:
         dict: Dictionary with 'start_date' and 'end_date' keys in DD-MM-YYYY format
@@ -186,24 +233,27 @@ def get_date_range_for_week(offset: int = 0):
         - "Last week's date range" -> get_date_range_for_week(-1)
         - "Next week's date range" -> get_date_range_for_week(1)
     """
-    today = datetime.date.today()
+    start_date, end_date = _date_range_for_week(today or _today(), offset)
+    return {"start_date": start_date, "end_date": end_date}
+
+@lru_cache(maxsize=256)
+def _date_range_for_week(today: datetime.date, offset: int):
+    """Returns the (start_date, end_date) strings of the week range; cached per day and offset."""
     # Calculate the start of the current week (Monday)
     current_week_start = today - datetime.timedelta(days=today.weekday())
     # Apply the offset
     target_week_start = current_week_start + datetime.timedelta(weeks=offset)
     target_week_end = target_week_start + datetime.timedelta(days=6)
     
-    return {
-        "start_date": target_week_start.strftime("%d-%m-%Y"),
-        "end_date": target_week_end.strftime("%d-%m-%Y")
-    }
+    return _format_date(target_week_start), _format_date(target_week_end)
 
-def get_date_range_for_quarter(offset: int = 0):
+def get_date_range_for_quarter(offset: int = 0, today: datetime.date = None):
     """
     Gets the start and end dates for a quarter, with an offset from the current quarter.
     
     Args:
         offset (int): Quarter offset from current quarter (0=current, -1=last, 1=next)
+        today (datetime.date, optional): Reference date. Uses current date if None.
     
     Returns:
         dict: Dictionary with 'start_date' and 'end_date' keys in DD-MM-YYYY format
@@ -214,23 +264,22 @@ def get_date_range_for_quarter(offset: int = 0):
         - "Last quarter's date range" -> get_date_range_for_quarter(-1)
         - "Next quarter's date range" -> get_date_range_for_quarter(1)
     """
-    today = datetime.date.today()
-    current_quarter = (today.month - 1) // 3 + 1
-    target_quarter_val = (today.year * 4) + current_quarter + offset
-    
-    target_year = (target_quarter_val -1) // 4
-    target_quarter_num = (target_quarter_val -1) % 4 + 1
+    start_date, end_date = _date_range_for_quarter(today or _today(), offset)
+    return {"start_date": start_date, "end_date": end_date}
 
-    start_month = 3 * target_quarter_num - 2
-    end_month = 3 * target_quarter_num
+@lru_cache(maxsize=256)
+def _date_range_for_quarter(today: datetime.date, offset: int):
+    """Returns the (start_date, end_date) strings of the quarter range; cached per day and offset."""
+    # Zero-based quarter index relative to the current year; floor division carries into the year
+    quarter = (today.month - 1) // 3 + offset
+    target_year = today.year + quarter // 4
+    start_month = 3 * (quarter % 4) + 1
+    end_month = start_month + 2
 
     start_date = datetime.date(target_year, start_month, 1)
-    end_date = datetime.date(target_year, end_month, 1).replace(day=1) + relativedelta(months=1, days=-1)
+    end_date = datetime.date(target_year, end_month, _days_in_month(target_year, end_month))
 
-    return {
-        "start_date": start_date.strftime("%d-%m-%Y"),
-        "end_date": end_date.strftime("%d-%m-%Y")
-    }
+    return _format_date(start_date), _format_date(end_date)
 
 if __name__ == '__main__':
     print("--- Date Tool Examples (20 Test Cases) ---")
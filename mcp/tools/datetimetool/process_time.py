@@ -1,4 +1,47 @@
 import datetime
+from types import MappingProxyType
+
+# Clock entry points; tests patch these names instead of the datetime module
+_now = datetime.datetime.now
+_today = datetime.date.today
+
+_TIME_WINDOWS = MappingProxyType({
+    'morning': ('00:00:00', '11:59:59'),
+    'afternoon': ('12:00:00', '17:59:59'),
+    'evening': ('18:00:00', '23:59:59'),
+})
+
+def _parse_date(date_str: str) -> datetime.date:
+    """
+    Parses a DD-MM-YYYY string into a date. The canonical zero-padded form is sliced directly;
+    anything else goes through strptime, which raises ValueError for invalid input.
+    """
+    if len(date_str) == 10 and date_str[2] == '-' and date_str[5] == '-':
+        day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            return datetime.date(int(year), int(month), int(day))
+    return datetime.datetime.strptime(date_str, "%d-%m-%Y").date()
+
+def _parse_datetime(datetime_str: str) -> datetime.datetime:
+    """
+    Parses a DD-MM-YYYY HH:MM:SS string into a datetime. The canonical zero-padded form is sliced directly;
+    anything else goes through strptime, which raises ValueError for invalid input.
+    """
+    if (len(datetime_str) == 19 and datetime_str[2] == '-' and datetime_str[5] == '-' and datetime_str[10] == ' '
+            and datetime_str[13] == ':' and datetime_str[16] == ':'):
+        fields = (datetime_str[6:10], datetime_str[3:5], datetime_str[0:2],
+                  datetime_str[11:13], datetime_str[14:16], datetime_str[17:19])
+        if all(field.isdigit() for field in fields):
+            return datetime.datetime(*map(int, fields))
+    return datetime.datetime.strptime(datetime_str, "%d-%m-%Y %H:%M:%S")
+
+def _format_date(value: datetime.date) -> str:
+    """Formats a date as DD-MM-YYYY without going through strftime."""
+    return f"{value.day:02d}-{value.month:02d}-{value.year:04d}"
+
+def _format_time(value: datetime.datetime) -> str:
+    """Formats the time of day as HH:MM:SS without going through strftime."""
+    return f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
 
 def get_current_time():
     """
@@ -11,7 +54,7 @@ def get_current_time():
         - "What time is it now?"
         - "Current time"
     """
-    return datetime.datetime.now().strftime("%H:%M:%S")
+    return _format_time(_now())
 
 def get_time_with_offset(offset: int, unit: str, base_datetime_str: str = None):
     """
@@ -33,13 +76,13 @@ def get_time_with_offset(offset: int, unit: str, base_datetime_str: str = None):
     """
     try:
         if base_datetime_str:
-            base_dt = datetime.datetime.strptime(base_datetime_str, "%d-%m-%Y %H:%M:%S")
+            base_dt = _parse_datetime(base_datetime_str)
         else:
-            base_dt = datetime.datetime.now()
+            base_dt = _now()
     except (ValueError, TypeError):
         return "Invalid base_datetime_str format. Please use 'DD-MM-YYYY HH:MM:SS'."
 
-    if unit not in ['seconds', 'minutes', 'hours']:
+    if unit not in {'seconds', 'minutes', 'hours'}:
         return f"Invalid unit '{unit}'. Please use 'seconds', 'minutes', or 'hours'."
 
     delta = datetime.timedelta(**{unit: offset})
@@ -48,10 +91,10 @@ def get_time_with_offset(offset: int, unit: str, base_datetime_str: str = None):
     # Check if the new datetime is on the same date as the base datetime
     if new_dt.date() == base_dt.date():
         # Same day: return only time
-        return new_dt.strftime("%H:%M:%S")
+        return _format_time(new_dt)
     else:
         # Different day: return full datetime
-        return new_dt.strftime("%d-%m-%Y %H:%M:%S")
+        return f"{_format_date(new_dt)} {_format_time(new_dt)}"
 
 def get_time_range_for_day_part(part_of_day: str, base_date_str: str = None):
     """
@@ -71,22 +114,16 @@ def get_time_range_for_day_part(part_of_day: str, base_date_str: str = None):
         - "Time range for tomorrow evening" -> get_time_range_for_day_part('evening', '19-07-2025')
     """
     try:
-        base_date = datetime.datetime.strptime(base_date_str, "%d-%m-%Y").date() if base_date_str else datetime.date.today()
+        base_date = _parse_date(base_date_str) if base_date_str else _today()
     except (ValueError, TypeError):
         return "Invalid date format. Please use DD-MM-YYYY."
 
-    part_of_day = part_of_day.lower()
-    time_windows = {
-        'morning': ('00:00:00', '11:59:59'),
-        'afternoon': ('12:00:00', '17:59:59'),
-        'evening': ('18:00:00', '23:59:59'),
-    }
-
-    if part_of_day not in time_windows:
+    time_window = _TIME_WINDOWS.get(part_of_day.lower())
+    if time_window is None:
         return f"Invalid part_of_day. Use 'morning', 'afternoon', or 'evening'."
 
-    start_time_str, end_time_str = time_windows[part_of_day]
-    date_str = base_date.strftime('%d-%m-%Y')
+    start_time_str, end_time_str = time_window
+    date_str = _format_date(base_date)
 
     return {
         "start_time": f"{date_str} {start_time_str}",
@@ -98,9 +135,9 @@ def _get_date_with_offset_for_testing(offset: int, unit: str):
     # This is a simplified version for demonstration within this script.
     # In a real MCP server, this would be a call to the process_date tool.
     from dateutil.relativedelta import relativedelta
-    today = datetime.date.today()
+    today = _today()
     delta = relativedelta(**{unit: offset})
-    return (today + delta).strftime("%d-%m-%Y")
+    return _format_date(today + delta)
 
 if __name__ == '__main__':
     print("--- Time Tool Examples (20 Test Cases) ---")
@@ -1,10 +1,6 @@
 import unittest
 import datetime
 from unittest.mock import patch
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetimetool.process_date import (
     get_current_date,
@@ -20,29 +16,19 @@ from datetimetool.process_date import (
 
 class TestProcessDateAtomic(unittest.TestCase):
 
-    @patch('datetimetool.process_date.datetime')
-    def test_get_current_date(self, mock_datetime):
+    def setUp(self):
+        # Every test runs with "today" fixed to Friday, July 18, 2025
+        patcher = patch('datetimetool.process_date._today', return_value=datetime.date(2025, 7, 18))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_current_date(self):
         """Test get_current_date function"""
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        
         result = get_current_date()
         self.assertEqual(result, "18-07-2025")
 
-    @patch('datetimetool.process_date.relativedelta')
-    @patch('datetimetool.process_date.datetime')
-    def test_get_date_with_offset_days(self, mock_datetime, mock_relativedelta):
+    def test_get_date_with_offset_days(self):
         """Test get_date_with_offset function with days"""
-        from dateutil.relativedelta import relativedelta
-        
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        
-        mock_base_date = datetime.date(2025, 1, 1)
-        mock_datetime.datetime.strptime.return_value.date.return_value = mock_base_date
-        
-        mock_relativedelta.side_effect = lambda **kwargs: relativedelta(**kwargs)
-        
         result = get_date_with_offset(5, 'days')
         self.assertEqual(result, "23-07-2025")
         
@@ -52,54 +38,44 @@ class TestProcessDateAtomic(unittest.TestCase):
         result = get_date_with_offset(10, 'days', base_date_str="01-01-2025")
         self.assertEqual(result, "11-01-2025")
 
-    @patch('datetimetool.process_date.relativedelta')
-    @patch('datetimetool.process_date.datetime')
-    def test_get_date_with_offset_weeks(self, mock_datetime, mock_relativedelta):
+    def test_get_date_with_offset_weeks(self):
         """Test get_date_with_offset function with weeks"""
-        from dateutil.relativedelta import relativedelta
-        
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_relativedelta.side_effect = lambda **kwargs: relativedelta(**kwargs)
-        
         result = get_date_with_offset(2, 'weeks')
         self.assertEqual(result, "01-08-2025")
         
         result = get_date_with_offset(-1, 'weeks')
         self.assertEqual(result, "11-07-2025")
 
-    @patch('datetimetool.process_date.relativedelta')
-    @patch('datetimetool.process_date.datetime')
-    def test_get_date_with_offset_months(self, mock_datetime, mock_relativedelta):
+    def test_get_date_with_offset_months(self):
         """Test get_date_with_offset function with months"""
-        from dateutil.relativedelta import relativedelta
-        
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_relativedelta.side_effect = lambda **kwargs: relativedelta(**kwargs)
-        
         result = get_date_with_offset(3, 'months')
         self.assertEqual(result, "18-10-2025")
         
         result = get_date_with_offset(-6, 'months')
         self.assertEqual(result, "18-01-2025")
 
-    @patch('datetimetool.process_date.relativedelta')
-    @patch('datetimetool.process_date.datetime')
-    def test_get_date_with_offset_years(self, mock_datetime, mock_relativedelta):
+    def test_get_date_with_offset_years(self):
         """Test get_date_with_offset function with years"""
-        from dateutil.relativedelta import relativedelta
-        
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_relativedelta.side_effect = lambda **kwargs: relativedelta(**kwargs)
-        
         result = get_date_with_offset(1, 'years')
         self.assertEqual(result, "18-07-2026")
         
         result = get_date_with_offset(-2, 'years')
         self.assertEqual(result, "18-07-2023")
 
+    def test_get_date_with_offset_clamps_to_month_end(self):
+        """Test get_date_with_offset function clamps the day when the target month is shorter"""
+        result = get_date_with_offset(1, 'months', base_date_str="31-01-2025")
+        self.assertEqual(result, "28-02-2025")
+        
+        result = get_date_with_offset(-1, 'months', base_date_str="31-03-2024")
+        self.assertEqual(result, "29-02-2024")
+        
+        result = get_date_with_offset(1, 'years', base_date_str="29-02-2024")
+        self.assertEqual(result, "28-02-2025")
+        
+        result = get_date_with_offset(-13, 'months', base_date_str="15-01-2025")
+        self.assertEqual(result, "15-12-2023")
+
     def test_get_date_with_offset_invalid_unit(self):
         """Test get_date_with_offset function with invalid unit"""
         result = get_date_with_offset(5, 'invalid')
@@ -110,18 +86,20 @@ class TestProcessDateAtomic(unittest.TestCase):
         result = get_date_with_offset(5, 'days', base_date_str="2025-07-18")
         self.assertIn("Invalid base_date_str format", result)
 
-    @patch('datetimetool.process_date.datetime')
-    def test_get_day_of_week(self, mock_datetime):
+        result = get_date_with_offset(5, 'days', base_date_str="31-02-2025")
+        self.assertIn("Invalid base_date_str format", result)
+
+    def test_get_date_with_offset_unpadded_base_date(self):
+        """Test get_date_with_offset function accepts a base date without zero padding"""
+        result = get_date_with_offset(1, 'days', base_date_str="1-2-2025")
+        self.assertEqual(result, "02-02-2025")
+
+    def test_get_day_of_week(self):
         """Test get_day_of_week function"""
-        mock_today = datetime.date(2025, 7, 18)  # Friday
-        mock_datetime.date.today.return_value = mock_today
-        
         result = get_day_of_week()
         self.assertEqual(result, "Friday")
         
-        mock_specific = datetime.date(2025, 12, 25)  # Thursday
-        mock_datetime.datetime.strptime.return_value.date.return_value = mock_specific
-        result = get_day_of_week("25-12-2025")
+        result = get_day_of_week("25-12-2025")  # Thursday
         self.assertEqual(result, "Thursday")
 
     def test_get_day_of_week_invalid_format(self):
@@ -129,20 +107,30 @@ class TestProcessDateAtomic(unittest.TestCase):
         result = get_day_of_week("2025-07-18")
         self.assertIn("Invalid date format", result)
 
-    @patch('datetimetool.process_date.datetime')
-    def test_get_date_of_weekday(self, mock_datetime):
+    def test_get_date_of_weekday(self):
         """Test get_date_of_weekday function"""
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_datetime.datetime.strptime.return_value.date.return_value = mock_today
-        mock_datetime.timedelta = datetime.timedelta
-        
         result = get_date_of_weekday('Monday', 'next')
         self.assertEqual(result, "21-07-2025")
         
         result = get_date_of_weekday('Wednesday', 'last')
         self.assertEqual(result, "16-07-2025")
 
+    def test_get_date_of_weekday_same_weekday(self):
+        """Test get_date_of_weekday function moves a full week when the base date is that weekday"""
+        result = get_date_of_weekday('Friday', 'next', base_date_str="18-07-2025")
+        self.assertEqual(result, "25-07-2025")
+
+        result = get_date_of_weekday('Friday', 'last', base_date_str="18-07-2025")
+        self.assertEqual(result, "11-07-2025")
+
+    def test_get_date_of_weekday_abbreviation(self):
+        """Test get_date_of_weekday function accepts three-letter weekday abbreviations"""
+        result = get_date_of_weekday('Mon', 'next', base_date_str="18-07-2025")
+        self.assertEqual(result, "21-07-2025")
+
+        result = get_date_of_weekday('wed', 'last', base_date_str="18-07-2025")
+        self.assertEqual(result, "16-07-2025")
+
     def test_get_date_of_weekday_invalid_weekday(self):
         """Test get_date_of_weekday function with invalid weekday"""
         result = get_date_of_weekday('InvalidDay', 'next')
@@ -153,14 +141,8 @@ class TestProcessDateAtomic(unittest.TestCase):
         result = get_date_of_weekday('Monday', 'invalid')
         self.assertIn("Invalid direction", result)
 
-    @patch('datetimetool.process_date.datetime')
-    def test_get_start_of_period(self, mock_datetime):
+    def test_get_start_of_period(self):
         """Test get_start_of_period function"""
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_datetime.datetime.strptime.return_value.date.return_value = mock_today
-        mock_datetime.timedelta = datetime.timedelta
-        
         result = get_start_of_period('week')
         self.assertEqual(result, "14-07-2025")
         
@@ -175,15 +157,8 @@ class TestProcessDateAtomic(unittest.TestCase):
         result = get_start_of_period('invalid')
         self.assertIn("Invalid period", result)
 
-    @patch('datetimetool.process_date.datetime')
-    def test_get_end_of_period(self, mock_datetime):
+    def test_get_end_of_period(self):
         """Test get_end_of_period function"""
-        # Mock current date as Friday, July 18, 2025
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_datetime.datetime.strptime.return_value.date.return_value = mock_today
-        mock_datetime.timedelta = datetime.timedelta
-        
         result = get_end_of_period('week')
         self.assertEqual(result, "20-07-2025")
         
@@ -193,13 +168,19 @@ class TestProcessDateAtomic(unittest.TestCase):
         result = get_end_of_period('year')
         self.assertEqual(result, "31-12-2025")
 
-    @patch('datetimetool.process_date.datetime')
-    def test_get_date_range_for_week(self, mock_datetime):
+    def test_get_end_of_period_month_february(self):
+        """Test get_end_of_period function for February in leap and common years"""
+        result = get_end_of_period('month', base_date_str="10-02-2024")
+        self.assertEqual(result, "29-02-2024")
+
+        result = get_end_of_period('month', base_date_str="10-02-2025")
+        self.assertEqual(result, "28-02-2025")
+
+        result = get_end_of_period('month', base_date_str="10-02-1900")
+        self.assertEqual(result, "28-02-1900")
+
+    def test_get_date_range_for_week(self):
         """Test get_date_range_for_week function"""
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_datetime.timedelta = datetime.timedelta
-        
         result = get_date_range_for_week(0)
         expected = {
             "start_date": "14-07-2025",
@@ -214,17 +195,16 @@ class TestProcessDateAtomic(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
-    @patch('datetimetool.process_date.relativedelta')
-    @patch('datetimetool.process_date.datetime')
-    def test_get_date_range_for_quarter(self, mock_datetime, mock_relativedelta):
+    def test_get_date_range_for_week_returns_fresh_dict(self):
+        """Test get_date_range_for_week function is not affected by callers mutating a previous result"""
+        result = get_date_range_for_week(0)
+        result["start_date"] = "mutated"
+
+        result = get_date_range_for_week(0)
+        self.assertEqual(result["start_date"], "14-07-2025")
+
+    def test_get_date_range_for_quarter(self):
         """Test get_date_range_for_quarter function"""
-        from dateutil.relativedelta import relativedelta
-        
-        mock_today = datetime.date(2025, 7, 18)
-        mock_datetime.date.today.return_value = mock_today
-        mock_datetime.date.side_effect = lambda *args: datetime.date(*args)
-        mock_relativedelta.side_effect = lambda **kwargs: relativedelta(**kwargs)
-        
         result = get_date_range_for_quarter(0)
         expected = {
             "start_date": "01-07-2025",
@@ -239,6 +219,21 @@ class TestProcessDateAtomic(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_get_date_range_with_today(self):
+        """Test week and quarter ranges with an explicit reference date"""
+        result = get_date_range_for_quarter(1, today=datetime.date(2025, 11, 3))
+        expected = {
+            "start_date": "01-01-2026",
+            "end_date": "31-03-2026"
+        }
+        self.assertEqual(result, expected)
+
+        result = get_date_range_for_quarter(-1, today=datetime.date(2025, 2, 14))
+        expected = {
+            "start_date": "01-10-2024",
+            "end_date": "31-12-2024"
+        }
+        self.assertEqual(result, expected)
 
-if __name__ == '__main__':
-    unittest.main()
+        result = get_date_range_for_week(0, today=datetime.date(2025, 11, 3))
+        self.assertEqual(result["start_date"], "03-11-2025")
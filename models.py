@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict
 
 class SearchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     age: Optional[int] = None
     age_limit_identifier: Optional[str] = None
     gender: Optional[str] = None
@@ -1,23 +1,63 @@
 import re
-from typing import Dict, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
 
-def parse_age(query: str) -> Dict[str, Optional[any]]:
+# The comparator must start on a word boundary so "moreover 30 years" is not read as "over"
+_AGE_PATTERN = r'(?:\b(?P<age_comparator>above|greater than|over|below|less than|under)\s*)?(?P<age>\d+)\s*years(?:\s+old)?'
+_AGE_RE = re.compile(_AGE_PATTERN)
+
+_AGE_COMPARATORS = {
+    "above": ">=",
+    "greater than": ">=",
+    "over": ">=",
+    "below": "<=",
+    "less than": "<=",
+    "under": "<=",
+}
+
+class AgeResult(NamedTuple):
+    age: Optional[int] = None
+    age_limit_identifier: Optional[str] = None
+
+_NO_AGE = AgeResult()
+
+# Joins batched queries; the age pattern cannot match across it, as it is neither a word nor a whitespace character
+_BATCH_SEPARATOR = "\x00"
+
+@lru_cache(maxsize=4096)
+def parse_age(query: str) -> AgeResult:
+    """
+    Parses the query string to extract age and age comparison information. Cached per query string.
     """
-    Parses the query string to extract age and age comparison information.
+    return _age_result_from_match(_AGE_RE.search(query))
+
+def _age_result_from_match(age_pattern_match: Optional[re.Match]) -> AgeResult:
     """
-    age_details = {"age": None, "age_limit_identifier": None}
-    
-    age_pattern_match = re.search(r'(above|greater than|over|below|less than|under)?\s*(\d+)\s*years( old)?', query)
-    if age_pattern_match:
-        age_comparator_keyword = age_pattern_match.group(1)
-        parsed_age = int(age_pattern_match.group(2))
-        
-        age_details["age"] = parsed_age
-        
-        if age_comparator_keyword:
-            if age_comparator_keyword in ["above", "greater than", "over"]:
-                age_details["age_limit_identifier"] = ">="
-            elif age_comparator_keyword in ["below", "less than", "under"]:
-                age_details["age_limit_identifier"] = "<="
-                
-    return age_details
+    Builds the age result from a match of the age pattern, or the empty result if there is none.
+    """
+    if not age_pattern_match:
+        return _NO_AGE
+    return AgeResult(int(age_pattern_match.group("age")), _AGE_COMPARATORS.get(age_pattern_match.group("age_comparator")))
+
+def parse_age_batch(queries: List[str]) -> List[AgeResult]:
+    """
+    Parses many query strings at once, giving the same results as calling parse_age on each of them.
+    Runs the age pattern over all queries in one pass and maps each match back to its query by offset.
+    """
+    if any(_BATCH_SEPARATOR in query for query in queries):
+        return [parse_age(query) for query in queries]
+
+    query_starts = []
+    offset = 0
+    for query in queries:
+        query_starts.append(offset)
+        offset += len(query) + 1
+
+    age_results = [_NO_AGE] * len(queries)
+    for age_pattern_match in _AGE_RE.finditer(_BATCH_SEPARATOR.join(queries)):
+        query_index = bisect_right(query_starts, age_pattern_match.start()) - 1
+        # Only the first match counts, as with search on a single query
+        if age_results[query_index] is _NO_AGE:
+            age_results[query_index] = _age_result_from_match(age_pattern_match)
+    return age_results
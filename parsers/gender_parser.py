@@ -1,9 +1,13 @@
+from functools import lru_cache
 from typing import Optional
 
+@lru_cache(maxsize=4096)
 def parse_gender(query: str) -> Optional[str]:
     """
     Parses the query string to extract gender information.
+    Expects the query to be lower-cased already; the search endpoint normalizes it once for all parsers.
     """
+    # "male" is a substring of "female", so "female" has to be checked first
     if "female" in query:
         return "female"
     elif "male" in query:
@@ -0,0 +1,44 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+from parsers.age_parser import _AGE_PATTERN, AgeResult, _age_result_from_match
+from parsers.time_parser import _TIME_PATTERN, TimeResult, _time_result, _time_spec_from_match
+
+_QUERY_RE = re.compile(f'(?P<age_clause>{_AGE_PATTERN})|(?P<gender>female|male)|(?P<time_clause>{_TIME_PATTERN})')
+
+class QueryResult(NamedTuple):
+    age: AgeResult
+    gender: Optional[str]
+    time: TimeResult
+
+def parse_all(query: str) -> QueryResult:
+    """
+    Parses the query string to extract age, gender and time information in a single pass.
+    Gives the same results as calling parse_age, parse_gender and parse_time separately.
+    """
+    age, gender, time_spec = _parse_query_spec(query)
+    return QueryResult(age, gender, _time_result(time_spec))
+
+@lru_cache(maxsize=4096)
+def _parse_query_spec(query: str) -> Tuple[AgeResult, Optional[str], Optional[Tuple[int, str]]]:
+    """
+    Returns the (age, gender, time_spec) found in the query. Cached per query string.
+    """
+    age_pattern_match = None
+    time_pattern_match = None
+    gender = None
+
+    for clause_match in _QUERY_RE.finditer(query):
+        clause = clause_match.lastgroup
+        if clause == "age_clause":
+            if age_pattern_match is None:
+                age_pattern_match = clause_match
+        elif clause == "gender":
+            # "female" wins over "male" wherever it appears, as in parse_gender
+            if gender != "female":
+                gender = clause_match.group("gender")
+        elif time_pattern_match is None:
+            time_pattern_match = clause_match
+
+    return _age_result_from_match(age_pattern_match), gender, _time_spec_from_match(time_pattern_match)
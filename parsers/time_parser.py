@@ -1,35 +1,65 @@
 import re
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
 
-def parse_time(query: str) -> Dict[str, Optional[any]]:
+# Word boundaries keep "blast 3 days" or "last 3 daysx" from being read as a time clause
+_TIME_PATTERN = r'\blast\s+(?P<time_quantity>\d+)\s+(?P<time_unit>day|hour|week|month|minute)s?\b'
+_TIME_RE = re.compile(_TIME_PATTERN)
+
+# Length in days of each unit that yields a date range; a month is approximated as 30 days
+_UNIT_DAYS = {"day": 1, "week": 7, "month": 30}
+
+class TimeResult(NamedTuple):
+    is_range: bool = False
+    time: Optional[str] = None
+    time_range: Optional[Dict[str, str]] = None
+
+_NO_TIME = TimeResult()
+
+def parse_time(query: str) -> TimeResult:
     """
     Parses the query string to extract time and time range information.
     """
-    time_details = {"is_range": False, "time": None, "time_range": None}
-    
-    time_pattern_match = re.search(r'last\s+(\d+)\s+(day|hour|week|month|minute)s?', query)
-    if time_pattern_match:
-        time_quantity = int(time_pattern_match.group(1))
-        time_unit = time_pattern_match.group(2)
-
-        if time_unit in ["day", "week", "month"]:
-            time_details["is_range"] = True
-            current_date = datetime.now()
-            if time_unit == "day":
-                time_delta = timedelta(days=time_quantity)
-            elif time_unit == "week":
-                time_delta = timedelta(weeks=time_quantity)
-            elif time_unit == "month":
-                time_delta = timedelta(days=time_quantity * 30)
-            
-            calculated_start_date = current_date - time_delta
-            time_details["time_range"] = {
-                "start_date": calculated_start_date.strftime("%d-%m-%Y"),
-                "end_date": current_date.strftime("%d-%m-%Y"),
-            }
-        elif time_unit in ["hour", "minute"]:
-            current_date = datetime.now()
-            time_details["time"] = current_date.strftime("%d-%m-%Y")
-            
-    return time_details
+    return _time_result(_parse_time_spec(query))
+
+@lru_cache(maxsize=4096)
+def _parse_time_spec(query: str) -> Optional[Tuple[int, str]]:
+    """
+    Returns the (time_quantity, time_unit) pair found in the query, or None. Cached per query string;
+    the clock is only read when the spec is turned into a result.
+    """
+    return _time_spec_from_match(_TIME_RE.search(query))
+
+def _time_spec_from_match(time_pattern_match: Optional[re.Match]) -> Optional[Tuple[int, str]]:
+    """
+    Reduces a match of the time pattern to its (time_quantity, time_unit) pair, or None if there is no match.
+    """
+    if not time_pattern_match:
+        return None
+    return int(time_pattern_match.group("time_quantity")), time_pattern_match.group("time_unit")
+
+def _time_result(time_spec: Optional[Tuple[int, str]]) -> TimeResult:
+    """
+    Builds the time result for a time spec relative to the current time, or the empty result if there is none.
+    """
+    if not time_spec:
+        return _NO_TIME
+
+    time_quantity, time_unit = time_spec
+    current_date = datetime.now()
+
+    if time_unit in _UNIT_DAYS:
+        calculated_start_date = current_date - timedelta(days=time_quantity * _UNIT_DAYS[time_unit])
+        return TimeResult(is_range=True, time_range={
+            "start_date": _format_date(calculated_start_date),
+            "end_date": _format_date(current_date),
+        })
+    # The pattern only admits hour and minute besides the range units
+    return TimeResult(time=_format_date(current_date))
+
+def _format_date(value: datetime) -> str:
+    """
+    Formats a datetime as DD-MM-YYYY, equivalent to strftime("%d-%m-%Y") without parsing the format.
+    """
+    return f"{value.day:02d}-{value.month:02d}-{value.year:04d}"
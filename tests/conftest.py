@@ -0,0 +1,17 @@
+import datetime
+
+import pytest
+
+from parsers import time_parser
+
+
+class _FrozenDatetime(datetime.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 7, 18, 14, 30, 45)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Fixes the time parser's current time to July 18, 2025 14:30:45"""
+    monkeypatch.setattr(time_parser, "datetime", _FrozenDatetime)
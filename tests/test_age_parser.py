@@ -0,0 +1,39 @@
+import pytest
+
+from parsers.age_parser import _AGE_RE, AgeResult, parse_age, parse_age_batch
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("over 30 years", AgeResult(30, ">=")),
+    ("patients below 12 years old", AgeResult(12, "<=")),
+    # The comparator has to start a word, so the "over" in "moreover" does not count
+    ("moreover 30 years", AgeResult(30, None)),
+    ("30 years  old", AgeResult(30, None)),
+    ("no age here", AgeResult()),
+])
+def test_parse_age(query, expected):
+    """Test parse_age function"""
+    assert parse_age(query) == expected
+
+
+def test_age_pattern_includes_old_after_any_whitespace():
+    """Test the age pattern takes in a trailing "old" after any run of whitespace"""
+    assert _AGE_RE.search("30 years  old").group(0) == "30 years  old"
+
+
+@pytest.mark.parametrize("queries", [
+    [],
+    [""],
+    ["", "over 30 years", ""],
+    ["over 60 years and under 10 years", "5 years"],
+    # Matches ending and starting right at the boundary between queries
+    ["under 5 years", "30 years old", "above 40 years"],
+    # A comparator at the end of one query must not pair with the age at the start of the next
+    ["over", "30 years"],
+    # A query containing the batch separator falls back to parsing each query on its own
+    ["over 30\x00 years", "under 5 years"],
+    ["female", "less than 18 years", "moreover 70 years"],
+])
+def test_parse_age_batch(queries):
+    """Test parse_age_batch function gives the same results as parse_age on each query"""
+    assert parse_age_batch(queries) == [parse_age(query) for query in queries]
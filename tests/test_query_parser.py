@@ -0,0 +1,85 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import query_path_app
+from parsers.age_parser import AgeResult, parse_age
+from parsers.gender_parser import parse_gender
+from parsers.query_parser import parse_all
+from parsers.time_parser import TimeResult, parse_time
+
+
+QUERIES = [
+    "female over 30 years last 3 days",
+    "male patients and female patients",
+    "female patients and male patients",
+    "males under 5 years old",
+    "patients seen recently",
+    "",
+    "over 60 years and under 10 years",
+    "last 2 weeks and last 5 hours",
+    "less than 18 years last 1 month male",
+    "last 4 minutes",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_parse_all_matches_separate_parsers(frozen_now, query):
+    """Test parse_all gives the same results as parse_age, parse_gender and parse_time"""
+    assert tuple(parse_all(query)) == (parse_age(query), parse_gender(query), parse_time(query))
+
+
+def test_parse_all_all_clauses(frozen_now):
+    """Test parse_all extracts age, gender and time from one query"""
+    assert parse_all("female over 30 years last 3 days") == (
+        AgeResult(30, ">="),
+        "female",
+        TimeResult(is_range=True, time_range={"start_date": "15-07-2025", "end_date": "18-07-2025"}),
+    )
+
+
+@pytest.mark.parametrize("query, gender", [
+    ("male patients and female patients", "female"),
+    ("female patients and male patients", "female"),
+    ("males", "male"),
+])
+def test_parse_all_gender(query, gender):
+    """Test parse_all prefers female over male wherever it appears"""
+    assert parse_all(query).gender == gender
+
+
+def test_parse_all_no_clauses():
+    """Test parse_all on a query without any recognised clause"""
+    assert parse_all("patients seen recently") == (AgeResult(), None, TimeResult())
+
+
+def test_parse_all_first_age_clause_wins():
+    """Test parse_all keeps the first of several age clauses"""
+    assert parse_all("over 60 years and under 10 years").age == AgeResult(60, ">=")
+
+
+def test_search_endpoint(frozen_now):
+    """Test the search endpoint lower-cases the query and returns every field"""
+    client = TestClient(query_path_app)
+
+    response = client.get("/search", params={"q": "Female over 30 years last 3 days"})
+    assert response.status_code == 200
+    assert response.json() == {
+        "age": 30,
+        "age_limit_identifier": ">=",
+        "gender": "female",
+        "diagnosis": None,
+        "is_range": True,
+        "time": None,
+        "time_range": {"start_date": "15-07-2025", "end_date": "18-07-2025"},
+    }
+
+    response = client.get("/search", params={"q": "nothing to see"})
+    assert response.json() == {
+        "age": None,
+        "age_limit_identifier": None,
+        "gender": None,
+        "diagnosis": None,
+        "is_range": False,
+        "time": None,
+        "time_range": None,
+    }
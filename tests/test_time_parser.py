@@ -0,0 +1,20 @@
+import pytest
+
+from parsers.time_parser import TimeResult, parse_time
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("last 3 days", TimeResult(is_range=True, time_range={"start_date": "15-07-2025", "end_date": "18-07-2025"})),
+    ("last 3 days, male", TimeResult(is_range=True, time_range={"start_date": "15-07-2025", "end_date": "18-07-2025"})),
+    ("last 2 weeks", TimeResult(is_range=True, time_range={"start_date": "04-07-2025", "end_date": "18-07-2025"})),
+    ("last 1 month", TimeResult(is_range=True, time_range={"start_date": "18-06-2025", "end_date": "18-07-2025"})),
+    ("last 2 hours", TimeResult(time="18-07-2025")),
+    ("last 10 minutes", TimeResult(time="18-07-2025")),
+    # "last" and the unit have to be whole words
+    ("blast 3 days", TimeResult()),
+    ("last 3 daysx", TimeResult()),
+    ("nothing recent", TimeResult()),
+])
+def test_parse_time(frozen_now, query, expected):
+    """Test parse_time function"""
+    assert parse_time(query) == expected